@@ -153,6 +153,36 @@ def test_control_c0_width_negative_1():
     assert length_phrase == expect_length_phrase
 
 
+def test_control_delete_width_negative_1():
+    """DEL (0x7f) at the end of an otherwise printable ASCII string reports -1."""
+    # given,
+    phrase = u'abc\x7f'
+    expect_length_each = (1, 1, 1, -1)
+    expect_length_phrase = -1
+
+    # exercise,
+    length_each = tuple(map(wcwidth.wcwidth, phrase))
+    length_phrase = wcwidth.wcswidth(phrase)
+
+    # verify.
+    assert length_each == expect_length_each
+    assert length_phrase == expect_length_phrase
+
+
+def test_control_after_non_ascii_width_negative_1():
+    """C0 and C1 control characters following non-ASCII characters report -1."""
+    # given,
+    phrases = (u'\xe9\x01', u'\u30b3\x85',
+               u'\xe9' * 10 + u'\x01', u'\u30b3' * 10 + u'\x85')
+    expect_lengths = (-1, -1, -1, -1)
+
+    # exercise,
+    lengths = tuple(map(wcwidth.wcswidth, phrases))
+
+    # verify.
+    assert lengths == expect_lengths
+
+
 def test_combining_width():
     """Simple test combining reports total width of 4."""
     # given,
@@ -400,3 +430,18 @@ def test_zero_wide_conflict():
     assert wcwidth.wcwidth(unichr(0x03099), unicode_version='4.1.0') == 0
     assert wcwidth.wcwidth(unichr(0x0309a), unicode_version='4.1.0') == 0
     assert wcwidth.wcwidth(unichr(0x0309b), unicode_version='4.1.0') == 2
+
+
+def test_wcswidth_many():
+    """wcswidth_many() returns the same width as wcswidth() for each string, in order."""
+    # given,
+    phrases = (u'', u'abc', u'\u30b3\u30f3\u30cb\u30c1\u30cf, \u30bb\u30ab\u30a4!',
+               u'\x1b[0m', u'--\u05bf--', u'\u2640\uFE0F')
+    expect_lengths = [wcwidth.wcswidth(phrase, unicode_version='9.0') for phrase in phrases]
+
+    # exercise,
+    lengths = wcwidth.wcswidth_many(iter(phrases), unicode_version='9.0')
+
+    # verify.
+    assert lengths == expect_lengths
+    assert lengths == [0, 3, 19, -1, 4, 2]
@@ -72,6 +72,28 @@ def test_unfinished_zwj_sequence():
     assert length_phrase == expect_length_phrase
 
 
+@pytest.mark.skipif(NARROW_ONLY, reason="Test cannot verify on python 'narrow' builds")
+def test_zwj_sequence_control_characters():
+    """
+    Ensure a control character after a zero-width joiner sequence is -1, unless joined itself
+    """
+    phrases = (
+        (u"\U0001f468"   # Base, Category So, East Asian Width property 'W' -- MAN
+         u"\u200d"       # Joiner, Category Cf, East Asian Width property 'N'  -- ZERO WIDTH JOINER
+         u"\U0001f469"   # Base, Category So, East Asian Width property 'W' -- WOMAN
+         u"\x01"),       # Control, Category Cc -- START OF HEADING
+        (u"\u200d"       # Joiner, Category Cf, East Asian Width property 'N'  -- ZERO WIDTH JOINER
+         u"\x01"),       # Control, Category Cc -- START OF HEADING
+    )
+    expect_lengths = (-1, 0)
+
+    # exercise,
+    lengths = tuple(map(wcwidth.wcswidth, phrases))
+
+    # verify.
+    assert lengths == expect_lengths
+
+
 @pytest.mark.skipif(NARROW_ONLY, reason="Test cannot verify on python 'narrow' builds")
 def test_non_recommended_zwj_sequence():
     """
@@ -240,4 +262,37 @@ def test_unicode_8_vs16():
 
     # verify.
     assert length_each == expect_length_each
-    assert length_phrase == expect_length_phrase
\ No newline at end of file
+    assert length_phrase == expect_length_phrase
+
+
+def test_vs16_sequence_edges():
+    """Verify VS-16 after an ASCII keycap base, zero width characters, and another VS-16."""
+    phrases = (
+        (u"#"              # NUMBER SIGN
+         u"\uFE0F"),       # VARIATION SELECTOR-16
+        (u"#"              # NUMBER SIGN
+         u"\u0301"         # COMBINING ACUTE ACCENT
+         u"\uFE0F"),       # VARIATION SELECTOR-16
+        (u"\u2764"         # HEAVY BLACK HEART
+         u"\u0301"         # COMBINING ACUTE ACCENT
+         u"\u200B"         # ZERO WIDTH SPACE
+         u"\uFE0F"),       # VARIATION SELECTOR-16
+        (u"\u2764"         # HEAVY BLACK HEART
+         u"\uFE0F"         # VARIATION SELECTOR-16
+         u"\uFE0F"),       # VARIATION SELECTOR-16
+    )
+    # each phrase is also measured followed by text long enough to be
+    # measured by its histogram of widths, rather than one character at a time.
+    padding = u"\u30b3" * 48  # KATAKANA LETTER KO
+    expect_lengths = (2, 2, 2, 2)
+    expect_lengths_padded = tuple(length + 96 for length in expect_lengths)
+
+    # exercise,
+    lengths = tuple(wcwidth.wcswidth(phrase, unicode_version='9.0')
+                    for phrase in phrases)
+    lengths_padded = tuple(wcwidth.wcswidth(phrase + padding, unicode_version='9.0')
+                           for phrase in phrases)
+
+    # verify.
+    assert lengths == expect_lengths
+    assert lengths_padded == expect_lengths_padded
@@ -1,6 +1,7 @@
 # coding: utf-8
 """Unicode version level tests for wcwidth."""
 # std imports
+import sys
 import warnings
 
 # 3rd party
@@ -180,3 +181,21 @@ def test_nonint_str():
 
     # verify.
     assert result == expected
+
+
+def test_auto_invalid_warns_on_first_measurement(monkeypatch):
+    """An invalid UNICODE_VERSION warns on first measurement with 'auto', not at import."""
+    # given,
+    monkeypatch.setenv('UNICODE_VERSION', 'foo')
+    monkeypatch.setattr(sys.modules['wcwidth.wcwidth'], '_DEFAULT_VERSION', None)
+    warnings.resetwarnings()
+    wcwidth._wcmatch_version.cache_clear()
+
+    # exercise,
+    with pytest.warns(UserWarning):
+        # warns that given version is invalid, latest is inferred
+        result = wcwidth.wcswidth(u'\u30b3')
+
+    # verify.
+    assert result == 2
+    wcwidth._wcmatch_version.cache_clear()
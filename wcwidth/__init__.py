@@ -16,12 +16,13 @@ from .wcwidth import (WIDE_EASTASIAN,
                       wcswidth,
                       _bisearch,
                       list_versions,
+                      wcswidth_many,
                       _wcmatch_version,
                       _wcversion_value)
 
 # The __all__ attribute defines the items exported from statement,
 # 'from wcwidth import *', but also to say, "This is the public API".
-__all__ = ('wcwidth', 'wcswidth', 'list_versions')
+__all__ = ('wcwidth', 'wcswidth', 'wcswidth_many', 'list_versions')
 
 # We also used pkg_resources to load unicode version tables from version.json,
 # generated by bin/update-tables.py, but some environments are unable to
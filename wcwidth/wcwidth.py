@@ -61,19 +61,55 @@ http://www.unicode.org/unicode/reports/tr11/
 Latest version: http://www.cl.cam.ac.uk/~mgk25/ucs/wcwidth.c
 """
 from __future__ import division
+
+# std imports
 import os
+import re
 import sys
+import bisect
 import warnings
+import itertools
+from array import array
+
+# local
 from .table_vs16 import VS16_NARROW_TO_WIDE
 from .table_wide import WIDE_EASTASIAN
 from .table_zero import ZERO_WIDTH
 from .unicode_versions import list_versions
+
 try:
+    # std imports
     from functools import lru_cache
 except ImportError:
+    # lru_cache was added in Python 3.2
+    # 3rd party
     from backports.functools_lru_cache import lru_cache
+
+# global cache
 _PY3 = sys.version_info[0] >= 3
 
+# C0 control characters and DEL, NUL is excluded as it is measured as 0 width.
+_ASCII_CONTROL = re.compile(u'[\x01-\x1f\x7f]')
+
+# Leading ASCII characters of a string, of any length.
+_ASCII_PREFIX = re.compile(u'[\x00-\x7f]*')
+
+try:
+    _isprintable = type(u'').isprintable
+except AttributeError:
+    # unicode.isprintable is not available in Python 2, strings are then
+    # always searched for control characters.
+    def _isprintable(text):  # pylint: disable=unused-argument
+        return False
+
+try:
+    _isascii = type(u'').isascii
+except AttributeError:
+    # unicode.isascii is not available before Python 3.7, the ASCII prefix of
+    # strings is then always searched.
+    def _isascii(text):  # pylint: disable=unused-argument
+        return False
+
 
 def _bisearch(ucs, table):
     """
@@ -85,27 +121,159 @@ def _bisearch(ucs, table):
     :rtype: int
     :returns: 1 if ordinal value ucs is found within lookup table, else 0.
     """
-    lbound = 0
-    ubound = len(table) - 1
+    # Every interval starting at or below ucs compares less than (ucs + 1,),
+    # so bisect_right() locates the only candidate interval without early
+    # return on equality, and its end value is compared just once.
+    idx = bisect.bisect_right(table, (ucs + 1,)) - 1
+    return int(idx >= 0 and ucs <= table[idx][1])
 
-    if ucs < table[0][0] or ucs > table[-1][1]:
-        return 0
 
-    while ubound >= lbound:
-        mid = (lbound + ubound) // 2
-        if ucs > table[mid][1]:
-            lbound = mid + 1
-        elif ucs < table[mid][0]:
-            ubound = mid - 1
-        else:
-            return 1
+def _flatten_table(table):
+    """
+    Flatten interval table into sorted array of half-open boundaries.
 
-    return 0
+    :arg list table: List of starting and ending ranges of ordinal values,
+        in form of ``[(start, end), ...]``.
+    :rtype: array.array
+    :returns: unsigned integer boundaries in form of ``[start, end + 1, ...]``,
+        an ordinal value is found within the table when
+        :func:`bisect.bisect_right` returns an odd index.
+    """
+    return array('I', [value for start, end in table for value in (start, end + 1)])
 
 
-@lru_cache(maxsize=1000)
-def wcwidth(wc, unicode_version='auto'):
+def _merge_tables(zero_table, wide_table, lbound):
+    """
+    Merge zero and wide interval tables into a single table of widths.
+
+    :arg list zero_table: List of starting and ending ranges of ordinal values
+        of zero width, in form of ``[(start, end), ...]``.
+    :arg list wide_table: List of starting and ending ranges of ordinal values
+        of wide width, in the same form.  Zero width takes precedence.
+    :arg int lbound: Lowest ordinal value measured by the merged table.
+    :rtype: tuple(array.array, array.array)
+    :returns: sorted boundaries and the width of each segment they divide,
+        ``(bounds, widths)``, such that the width of any ordinal value ``ucs``
+        at or above ``lbound`` is ``widths[bisect_right(bounds, ucs)]``.
+    """
+    zero_flat = _flatten_table(zero_table)
+    wide_flat = _flatten_table(wide_table)
+
+    def _width(ucs):
+        if bisect.bisect_right(zero_flat, ucs) & 1:
+            return 0
+        return 1 + (bisect.bisect_right(wide_flat, ucs) & 1)
+
+    bounds, widths = array('I'), array('b', [_width(lbound)])
+    for value in sorted(set(value for value in zero_flat + wide_flat if value > lbound)):
+        width = _width(value)
+        if width != widths[-1]:
+            bounds.append(value)
+            widths.append(width)
+    return bounds, widths
+
+
+def _bmp_table(unicode_version):
+    """
+    Build lookup table of widths for the Basic Multilingual Plane.
+
+    The table costs 64KiB of memory, in exchange for measuring any codepoint
+    below ``0x10000`` by a single index, without any binary search.
+
+    :param str unicode_version: A matching unicode version level, as returned
+        by :func:`_wcmatch_version`.
+    :rtype: array.array
+    :returns: signed byte array of length ``0x10000``, where the value at index
+        ``ucs`` is the result of :func:`wcwidth` for that codepoint.
+    """
+    table = array('b', [1]) * 0x10000
+    # zero width takes precedence over wide, and C0/C1 control characters
+    # take precedence over both, in the same order as wcwidth() measures.
+    for width, intervals in ((2, WIDE_EASTASIAN[unicode_version]),
+                             (0, ZERO_WIDTH[unicode_version]),
+                             (-1, ((1, 0x1F), (0x7F, 0x9F)))):
+        for start, end in intervals:
+            if start < 0x10000:
+                end = min(end, 0xFFFF)
+                table[start:end + 1] = array('b', [width]) * (end + 1 - start)
+    return table
+
+
+def _bmp_translate_table(unicode_version):
+    r"""
+    Build table for :meth:`str.translate` of widths for the Basic Multilingual Plane.
+
+    :param str unicode_version: A matching unicode version level, as returned
+        by :func:`_wcmatch_version`.
+    :rtype: str
+    :returns: string of length ``0x10000``, where the character at index ``ucs``
+        is ``'\x00'``, ``'\x01'`` or ``'\x02'`` for the width of that
+        codepoint, or ``'\xff'`` for -1.
     """
+    table = _BMP_TABLES[unicode_version]
+    # array.tostring() was renamed to tobytes() in Python 3.2
+    return (table.tobytes() if _PY3 else table.tostring()).decode('latin-1')
+
+
+class _LazyTables(dict):
+    """Tables keyed by unicode version, built on first use by the given function."""
+
+    def __init__(self, build):
+        dict.__init__(self)
+        self._build = build
+
+    def __missing__(self, unicode_version):
+        table = self[unicode_version] = self._build(unicode_version)
+        return table
+
+
+# Widths of every codepoint of the Basic Multilingual Plane, keyed by unicode
+# version, so that any codepoint is measured by a single C-level subscript of
+# this dict and its table, without any python-level function call.
+_BMP_TABLES = _LazyTables(_bmp_table)
+_BMP_TRANSLATE_TABLES = _LazyTables(_bmp_translate_table)
+
+# Widths of codepoints of the supplementary planes, keyed by unicode version,
+# merged from ZERO_WIDTH and WIDE_EASTASIAN so that any codepoint is measured
+# by a single C-level call to bisect_right() over one contiguous array.
+_SUPPLEMENTARY_WIDTHS = _LazyTables(
+    lambda unicode_version: _merge_tables(ZERO_WIDTH[unicode_version],
+                                          WIDE_EASTASIAN[unicode_version], 0x10000))
+
+# Each of these tables is built only on first measurement of a character of
+# its range, at its unicode version level, so that programs measuring only
+# ASCII, or a single unicode version level, pay neither time nor memory for
+# any other tables.
+
+# Deletes the widths mapped by _BMP_TRANSLATE_TABLES, leaving only characters
+# of the supplementary planes.
+_DELETE_BMP_WIDTHS = {0: None, 1: None, 2: None}
+
+
+# Ordinal values of characters converted from narrow to wide by a following
+# VS-16, expanded from their ranges for a single hash lookup each.
+_VS16_NARROW_TO_WIDE_SET = frozenset(ucs for start, end in VS16_NARROW_TO_WIDE['9.0.0']
+                                     for ucs in range(start, end + 1))
+
+# Strings with fewer than _TRANSLATE_MIN_LENGTH characters following their
+# ASCII prefix, such as most cells of a terminal, are measured one character
+# at a time, as the fixed cost of str.translate() and its histogram exceeds
+# that of a loop over so few characters.
+_TRANSLATE_MIN_LENGTH = 8
+
+# Strings containing VS-16 are measured by str.translate() only when at least
+# _VS16_SPLIT_MIN_LENGTH characters follow their ASCII prefix for each VS-16,
+# as the string is then split and searched once more for each VS-16.
+_VS16_SPLIT_MIN_LENGTH = 24
+
+# Widths measured by wcwidth(), keyed by given unicode version and character,
+# each version caching no more than _WIDTH_CACHE_MAXSIZE characters.
+_WIDTH_CACHE = {}
+_WIDTH_CACHE_MAXSIZE = 10000
+
+
+def wcwidth(wc, unicode_version='auto'):
+    r"""
     Given one Unicode character, return its printable length on a terminal.
 
     :param str wc: A single Unicode character.
@@ -118,7 +286,7 @@ def wcwidth(wc, unicode_version='auto'):
         highest Unicode version level is used.
     :return: The width, in cells, necessary to display the character of
         Unicode string character, ``wc``.  Returns 0 if the ``wc`` argument has
-        no printable effect on a terminal (such as NUL '\\0'), -1 if ``wc`` is
+        no printable effect on a terminal (such as NUL '\0'), -1 if ``wc`` is
         not printable, or has an indeterminate effect on the terminal, such as
         a control character.  Otherwise, the number of column positions the
         character occupies on a graphic terminal (1 or 2) is returned.
@@ -126,26 +294,40 @@ def wcwidth(wc, unicode_version='auto'):
 
     See :ref:`Specification` for details of cell measurement.
     """
-    ucs = ord(wc)
-    
-    # C0/C1 control characters
-    if ucs < 32 or 0x07F <= ucs < 0x0A0:
-        return -1
-
-    # Check if the character is in the zero width table
-    if _bisearch(ucs, ZERO_WIDTH):
-        return 0
-
-    # Check if the character is in the wide East Asian table
-    if _bisearch(ucs, WIDE_EASTASIAN):
-        return 2
-
-    # Check if it's a combining character
-    if ucs in VS16_NARROW_TO_WIDE:
-        return 2
+    try:
+        return _WIDTH_CACHE[unicode_version][wc]
+    except KeyError:
+        pass
+
+    ucs = ord(wc) if wc else 0
+
+    if ucs < 0x0A0:
+        # ASCII and C1 control characters, before any unicode version level is
+        # matched, as it has no effect on their width.  A single comparison
+        # excludes them for all other characters.
+        if 32 <= ucs < 0x7F:
+            # printable ASCII
+            width = 1
+        elif ucs:
+            # C0/C1 control characters are -1 for compatibility with POSIX-like calls
+            width = -1
+        else:
+            # NUL
+            width = 0
+    else:
+        _unicode_version = _resolve_version(unicode_version)
+        if ucs < 0x10000:
+            # Basic Multilingual Plane, by direct index of lookup table
+            width = _BMP_TABLES[_unicode_version][ucs]
+        else:
+            # Supplementary planes, 0, 1 or 2 width by merged interval table
+            bounds, widths = _SUPPLEMENTARY_WIDTHS[_unicode_version]
+            width = widths[bisect.bisect_right(bounds, ucs)]
 
-    # All other characters are considered to have a width of 1
-    return 1
+    widths = _WIDTH_CACHE.setdefault(unicode_version, {})
+    if len(widths) < _WIDTH_CACHE_MAXSIZE:
+        widths[wc] = width
+    return width
 
 
 def wcswidth(pwcs, n=None, unicode_version='auto'):
@@ -169,20 +351,213 @@ def wcswidth(pwcs, n=None, unicode_version='auto'):
 
     See :ref:`Specification` for details of cell measurement.
     """
-    if n is None:
-        n = len(pwcs)
-    
+    _unicode_version = _resolve_version(unicode_version)
+    return _wcswidth(pwcs if n is None else pwcs[:n], _unicode_version)
+
+
+def wcswidth_many(strings, unicode_version='auto'):
+    """
+    Given many unicode strings, return the printable length of each on a terminal.
+
+    The unicode version level is matched only once for all strings, such as
+    for each line of a screen of text, otherwise equal to :func:`wcswidth`.
+
+    :param iterable strings: Unicode strings to measure.
+    :param str unicode_version: An explicit definition of the unicode version
+        level to use for determination, may be ``auto`` (default), which uses
+        the Environment Variable, ``UNICODE_VERSION`` if defined, or the latest
+        available unicode version, otherwise.
+    :rtype: list[int]
+    :returns: The width, in cells, needed to display each of the given strings,
+        in the same order, as returned by :func:`wcswidth`.
+
+    See :ref:`Specification` for details of cell measurement.
+    """
+    _unicode_version = _resolve_version(unicode_version)
+    return [_wcswidth(text, _unicode_version) for text in strings]
+
+
+def _wcswidth(text, unicode_version):
+    """
+    Return printable length of unicode string on a terminal.
+
+    :param str text: Measure width of given unicode string.
+    :param str unicode_version: A matching unicode version level, as returned
+        by :func:`_wcmatch_version`.
+    :rtype: int
+    :returns: The width, in cells, needed to display ``text``, as returned by
+        :func:`wcswidth`.
+    """
+    end = len(text)
+    if end == 1:
+        # small optimization: a single character, such as a cell of a terminal,
+        # is measured by wcwidth(), which is equal for a lone ZWJ or VS-16.
+        return wcwidth(text, unicode_version)
+
+    printable = _isprintable(text)
+    idx, width = _ascii_prefix_width(text, printable)
+    if width < 0 or idx == end:
+        return width
+
+    # small optimization: without any Zero Width Joiner, the width of each
+    # character does not depend on its neighbors, other than VS-16.  When at
+    # least _TRANSLATE_MIN_LENGTH characters follow the ASCII prefix, which
+    # contains neither, the string is measured by a histogram of widths.
+    if (end - idx >= _TRANSLATE_MIN_LENGTH and u'\u200D' not in text
+            and end - idx >= _VS16_SPLIT_MIN_LENGTH * text.count(u'\uFE0F')):
+        tail_width = _wcswidth_translate(text, idx, printable, unicode_version)
+    else:
+        tail_width = _wcswidth_sequential(text, idx, unicode_version)
+    return -1 if tail_width < 0 else width + tail_width
+
+
+def _ascii_prefix_width(text, printable):
+    """
+    Return printable length of the leading ASCII characters of unicode string.
+
+    :param str text: Measure width of leading ASCII characters of given string.
+    :param bool printable: Whether ``text`` is known to be printable.
+    :rtype: tuple(int, int)
+    :returns: index of the first non-ASCII character of ``text``, or its
+        length, and the width of the characters before it, or ``-1`` when
+        they contain any C0 control characters, ``(idx, width)``.
+    """
+    # small optimization: the leading ASCII characters of the string, all of
+    # an ASCII string, or otherwise matched by a single C-level regular
+    # expression, are measured by their length, less any NUL characters,
+    # unless they contain any C0 control characters.  A printable string,
+    # determined by a single C-level scan, contains neither, so that neither
+    # must be searched.  A string starting with a non-ASCII character, such
+    # as most short cells of a terminal, has no prefix to match or search.
+    if _isascii(text):
+        idx = len(text)
+    elif text[:1] >= u'\x80':
+        idx = 0
+    else:
+        idx = _ASCII_PREFIX.match(text).end()
+    if printable or not idx:
+        return idx, idx
+    if _ASCII_CONTROL.search(text, 0, idx):
+        return idx, -1
+    return idx, idx - text.count(u'\x00', 0, idx)
+
+
+def _last_ascii_measured(text, idx):
+    """
+    Return the last ASCII character measured to contain a cell, if any.
+
+    :param str text: Unicode string.
+    :param int idx: Length of the ASCII prefix of ``text``.
+    :rtype: str
+    :returns: the last character before ``idx`` that is not NUL, or an
+        empty string, which may be followed by VS-16.
+    """
+    return text[:idx].rstrip(u'\x00')[-1:]
+
+
+def _wcswidth_translate(text, idx, printable, unicode_version):
+    """
+    Return printable length of unicode string without ZWJ, by histogram of widths.
+
+    :param str text: Measure width of given unicode string, from ``idx``.
+    :param int idx: Length of the ASCII prefix of ``text``, already measured.
+    :param bool printable: Whether ``text`` is known to be printable.
+    :param str unicode_version: A matching unicode version level, as returned
+        by :func:`_wcmatch_version`.
+    :rtype: int
+    :returns: The width, in cells, needed to display ``text[idx:]``, following
+        its ASCII prefix, or ``-1`` for C0 and C1 control characters.
+    """
+    # Each BMP character is mapped to its width by a single C-level call to
+    # str.translate(), and the string is measured by a histogram of these
+    # widths, totaled by count.  Only characters of the supplementary planes,
+    # if any, are measured one at a time.
+    tail = text[idx:]
+    widths = tail.translate(_BMP_TRANSLATE_TABLES[unicode_version])
+    if not printable and u'\xff' in widths:
+        return -1
+    width = widths.count(u'\x01') + 2 * widths.count(u'\x02')
+    width += sum(map(wcwidth, widths.translate(_DELETE_BMP_WIDTHS),
+                     itertools.repeat(unicode_version)))
+    # VS-16 has effect only for unicode version level 9.0.0 and later
+    if u'\uFE0F' in tail and _VERSION_VALUES[unicode_version] >= (9, 0, 0):
+        # VS-16 is measured as zero width by the histogram, add '1' for
+        # each that follows a character it converts from narrow to wide,
+        # which is the last character measured to contain a cell since
+        # any previous VS-16, or the last ASCII character measured.
+        segments = tail.split(u'\uFE0F')
+        for num, segment in enumerate(segments[:-1]):
+            char = next((char for char in reversed(segment)
+                         if wcwidth(char, unicode_version) > 0),
+                        None if num else _last_ascii_measured(text, idx))
+            if char and ord(char) in _VS16_NARROW_TO_WIDE_SET:
+                width += 1
+    return width
+
+
+def _wcswidth_sequential(text, idx, unicode_version):
+    """
+    Return printable length of unicode string, one character at a time.
+
+    :param str text: Measure width of given unicode string, from ``idx``.
+    :param int idx: Length of the ASCII prefix of ``text``, already measured.
+    :param str unicode_version: A matching unicode version level, as returned
+        by :func:`_wcmatch_version`.
+    :rtype: int
+    :returns: The width, in cells, needed to display ``text[idx:]``, following
+        its ASCII prefix, or ``-1`` for C0 and C1 control characters.
+    """
+    # Fetch the lookup table only once for the whole string, each character of
+    # the Basic Multilingual Plane is then measured by direct index, and each
+    # character of the supplementary planes by direct lookup of the cache of
+    # wcwidth(), which is called only on a cache miss.
+    bmp_table = _BMP_TABLES[unicode_version]
+    cached_widths = _WIDTH_CACHE.setdefault(unicode_version, {})
+    tail = text[idx:]
+
+    # VS-16 has effect only for unicode version level 9.0.0 and later
+    _vs16_effect = u'\uFE0F' in tail and _VERSION_VALUES[unicode_version] >= (9, 0, 0)
+
+    # track the last ASCII character measured, which may be followed by VS-16
+    last_measured_char = _last_ascii_measured(text, idx) if idx and _vs16_effect else None
     width = 0
-    for char in pwcs[:n]:
-        char_width = wcwidth(char, unicode_version)
-        if char_width == -1:
-            return -1
-        width += char_width
-    
+    skip_next = False
+    for char in tail:
+        if skip_next:
+            skip_next = False
+            continue
+        if char == u'\u200D':
+            # Zero Width Joiner, do not measure this or next character
+            skip_next = True
+            continue
+        if char == u'\uFE0F' and last_measured_char:
+            # on variation selector 16 (VS16) following another character,
+            # conditionally add '1' to the measured width if that character is
+            # known to be converted from narrow to wide by the VS16 character.
+            if _vs16_effect:
+                if ord(last_measured_char) in _VS16_NARROW_TO_WIDE_SET:
+                    width += 1
+                last_measured_char = None
+            continue
+        # measure character, inline of wcwidth()
+        ucs = ord(char)
+        if ucs < 0x10000:
+            wcw = bmp_table[ucs]
+        else:
+            wcw = cached_widths.get(char)
+            if wcw is None:
+                wcw = wcwidth(char, unicode_version)
+        if wcw < 0:
+            # early return -1 on C0 and C1 control characters
+            return wcw
+        if wcw > 0:
+            # track last character measured to contain a cell, so that
+            # subsequent VS-16 modifiers may be understood
+            last_measured_char = char
+        width += wcw
     return width
 
 
-@lru_cache(maxsize=128)
 def _wcversion_value(ver_string):
     """
     Integer-mapped value of given dotted version string.
@@ -191,7 +566,8 @@ def _wcversion_value(ver_string):
     :rtype: tuple(int)
     :returns: tuple of digit tuples, ``tuple(int, [...])``.
     """
-    return tuple(map(int, ver_string.split('.')))
+    retval = tuple(map(int, (ver_string.split('.'))))
+    return retval
 
 
 @lru_cache(maxsize=8)
@@ -219,21 +595,118 @@ def _wcmatch_version(given_version):
     :returns: unicode string, or non-unicode ``str`` type for python 2
         when given ``version`` is also type ``str``.
     """
-    if given_version == 'auto':
-        given_version = os.environ.get('UNICODE_VERSION', 'latest')
-    
-    if given_version == 'latest':
-        return list_versions()[-1]
-    
-    supported_versions = list_versions()
-    given_value = _wcversion_value(given_version)
-    
-    for version in reversed(supported_versions):
-        if _wcversion_value(version) <= given_value:
-            if version != given_version:
-                warnings.warn(f"Unicode version '{given_version}' not found, using '{version}'")
-            return version
-    
-    # If no suitable version found, return the earliest supported version
-    warnings.warn(f"Unicode version '{given_version}' not found, using '{supported_versions[0]}'")
-    return supported_versions[0]
+    # Design note: the choice to return the same type that is given certainly
+    # complicates it for python 2 str-type, but allows us to define an api that
+    # uses 'string-type' for unicode version level definitions, so all of our
+    # example code works with all versions of python.
+    _return_str = not _PY3 and isinstance(given_version, str)
+
+    if _return_str:
+        # avoid list-comprehension to work around a coverage issue:
+        # https://github.com/nedbat/coveragepy/issues/753
+        unicode_versions = list(map(lambda ucs: ucs.encode(), list_versions()))
+    else:
+        unicode_versions = list_versions()
+    latest_version = unicode_versions[-1]
+
+    if given_version in (u'auto', 'auto'):
+        given_version = os.environ.get(
+            'UNICODE_VERSION',
+            'latest' if not _return_str else latest_version.encode())
+
+    if given_version in (u'latest', 'latest'):
+        # default match, when given as 'latest', use the most latest unicode
+        # version specification level supported.
+        return latest_version if not _return_str else latest_version.encode()
+
+    if given_version in unicode_versions:
+        # exact match, downstream has specified an explicit matching version
+        # matching any value of list_versions().
+        return given_version if not _return_str else given_version.encode()
+
+    # The user's version is not supported by ours. We return the newest unicode
+    # version level that we support below their given value.
+    try:
+        cmp_given = _wcversion_value(given_version)
+
+    except ValueError:
+        # submitted value raises ValueError in int(), warn and use latest.
+        warnings.warn("UNICODE_VERSION value, {given_version!r}, is invalid. "
+                      "Value should be in form of `integer[.]+', the latest "
+                      "supported unicode version {latest_version!r} has been "
+                      "inferred.".format(given_version=given_version,
+                                         latest_version=latest_version))
+        return latest_version if not _return_str else latest_version.encode()
+
+    # given version is less than any available version, return earliest
+    # version.
+    earliest_version = unicode_versions[0]
+    cmp_earliest_version = _VERSION_VALUES[earliest_version]
+
+    if cmp_given <= cmp_earliest_version:
+        # this probably isn't what you wanted, the oldest wcwidth.c you will
+        # find in the wild is likely version 5 or 6, which we both support,
+        # but it's better than not saying anything at all.
+        warnings.warn("UNICODE_VERSION value, {given_version!r}, is lower "
+                      "than any available unicode version. Returning lowest "
+                      "version level, {earliest_version!r}".format(
+                          given_version=given_version,
+                          earliest_version=earliest_version))
+        return earliest_version if not _return_str else earliest_version.encode()
+
+    # create list of versions which are less than our equal to given version,
+    # and return the tail value, which is the highest level we may support,
+    # or the latest value we support, when completely unmatched or higher
+    # than any supported version.
+    #
+    # function will never complete, always returns.
+    for idx, unicode_version in enumerate(unicode_versions):
+        # look ahead to next value
+        try:
+            cmp_next_version = _VERSION_VALUES[unicode_versions[idx + 1]]
+        except IndexError:
+            # at end of list, return latest version
+            return latest_version if not _return_str else latest_version.encode()
+
+        # Maybe our given version has less parts, as in tuple(8, 0), than the
+        # next compare version tuple(8, 0, 0). Test for an exact match by
+        # comparison of only the leading dotted piece(s): (8, 0) == (8, 0).
+        if cmp_given == cmp_next_version[:len(cmp_given)]:
+            return unicode_versions[idx + 1]
+
+        # Or, if any next value is greater than our given support level
+        # version, return the current value in index.  Even though it must
+        # be less than the given value, its our closest possible match. That
+        # is, 4.1 is returned for given 4.9.9, where 4.1 and 5.0 are available.
+        if cmp_next_version > cmp_given:
+            return unicode_version
+    assert False, ("Code path unreachable", given_version, unicode_versions)  # pragma: no cover
+
+
+# Integer-mapped values of each supported unicode version level, parsed once.
+_VERSION_VALUES = dict((ver, _wcversion_value(ver)) for ver in list_versions())
+
+# Unicode version level matching 'auto', resolved only once from Environment
+# Variable UNICODE_VERSION, on first measurement rather than for each.
+_DEFAULT_VERSION = None
+
+
+def _resolve_version(unicode_version):
+    """
+    Return nearest matching unicode version level of given version.
+
+    The version level matching ``auto`` is retained on first use, any warning
+    of an invalid ``UNICODE_VERSION`` is then emitted by the first call to
+    measure with ``auto``, rather than at import.
+
+    :param str unicode_version: given version, as accepted by
+        :func:`_wcmatch_version`.
+    :rtype: str
+    :returns: unicode version level, as returned by :func:`_wcmatch_version`.
+    """
+    global _DEFAULT_VERSION  # pylint: disable=global-statement
+    if unicode_version != 'auto':
+        return _wcmatch_version(unicode_version)
+    if _DEFAULT_VERSION is None:
+        _DEFAULT_VERSION = _wcmatch_version('auto')
+    return _DEFAULT_VERSION